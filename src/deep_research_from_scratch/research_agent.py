@@ -11,6 +11,11 @@ Key features:
 - Workflow state tracking to guide research process
 """
 
+import asyncio
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
@@ -19,7 +24,7 @@ from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, fi
 from langchain.chat_models import init_chat_model
 
 from deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState
-from deep_research_from_scratch.utils import tavily_search, get_today_str, think_tool
+from deep_research_from_scratch.utils import LLMCache, tavily_search, format_prompt_with_date, think_tool, prune_messages_for_compression, shared_http_client, shared_http_async_client
 from deep_research_from_scratch.prompts import research_agent_prompt, compress_research_system_prompt, compress_research_human_message
 
 # ===== CONFIGURATION =====
@@ -35,9 +40,16 @@ model = init_chat_model(
     base_url="http://localhost:8080/v1",
     api_key="sk-no-key",
     temperature=0.2,
+    http_client=shared_http_client,
+    http_async_client=shared_http_async_client,
 )
 model_with_tools = model.bind_tools(tools)
 
+# Cache model responses keyed on (system prompt, pruned messages, tool names).
+# Only safe at low temperature, where repeated inputs give identical outputs.
+_llm_cache = LLMCache()
+_llm_cache_enabled = (getattr(model, "temperature", None) or 0) <= 0.2
+
 # Initialize summarization model (with json_mode for structured output) - uses base LFM2 on port 8081
 summarization_model = (
     init_chat_model(
@@ -46,11 +58,13 @@ summarization_model = (
         base_url="http://localhost:8081/v1",
         api_key="sk-no-key",
         temperature=0.2,
+        http_client=shared_http_client,
+        http_async_client=shared_http_async_client,
     )
     .bind(
         response_format={"type": "json_object"},
         max_tokens=1024,
-        extra_body={"cache_prompt": False}
+        extra_body={"cache_prompt": True}  # Let llama.cpp reuse the prompt prefix KV cache
     )
 )
 
@@ -63,10 +77,58 @@ compress_model = init_chat_model(
     api_key="sk-no-key",
     temperature=0.2,
     max_tokens=32000,
+    http_client=shared_http_client,
+    http_async_client=shared_http_async_client,
 )
 
+# Tool results longer than this are stored out-of-band in state["tool_blobs"]
+# and replaced with a truncated preview in the message history
+TOOL_BLOB_THRESHOLD = 6000
+
+# Interned tool-name constants. Tool-call names are interned on receipt from
+# the model, so hot-path comparisons against these become pointer checks
+# ('is') instead of byte-by-byte string compares.
+_TAVILY_SEARCH = sys.intern("tavily_search")
+_THINK_TOOL = sys.intern("think_tool")
+
 # ===== AGENT NODES =====
 
+def _truncate_tool_outputs(tool_outputs):
+    """Move oversized tool-result content into an out-of-band blob dict.
+
+    ToolMessages over TOOL_BLOB_THRESHOLD chars keep only a truncated preview;
+    the full content is returned keyed by tool_call_id so compress_research
+    can still recover it, while per-turn checkpoint serialization and message
+    scans stay bounded.
+    """
+    tool_blobs = {}
+    for tool_output in tool_outputs:
+        content = tool_output.content
+        if isinstance(content, str) and len(content) > TOOL_BLOB_THRESHOLD:
+            tool_blobs[tool_output.tool_call_id] = content
+            tool_output.content = (
+                content[:TOOL_BLOB_THRESHOLD]
+                + f"\n... <truncated {len(content) - TOOL_BLOB_THRESHOLD} chars; "
+                f"full result kept for final notes>"
+            )
+    return tool_blobs
+
+def _rewrap_as_human(message) -> HumanMessage:
+    """Rewrap a message's content as a HumanMessage, copying only if needed."""
+    content = getattr(message, 'content', '')
+    if not isinstance(content, str):
+        content = str(content)
+    return HumanMessage(content=content)
+
+# Last-message pruning dispatch keyed on concrete message type: HumanMessages
+# pass through untouched, everything else gets rewrapped (LFM2 only reliably
+# calls tools in response to HumanMessages). Replaces an isinstance ladder on
+# the hot path with a single dict lookup.
+_PRUNE_DISPATCH = {
+    HumanMessage: lambda message: message,
+    ToolMessage: _rewrap_as_human,
+}
+
 def llm_call(state: ResearcherState):
     """Analyze current state and decide on next actions with LFM2 compatibility.
 
@@ -81,27 +143,24 @@ def llm_call(state: ResearcherState):
     # Critical: LFM2 only calls tools in response to HumanMessages, not ToolMessages
     messages = state["researcher_messages"]
 
-    # Extract research question
-    research_question = ""
-    for msg in messages:
-        if isinstance(msg, HumanMessage):
-            research_question = msg.content
-            break
-
-    # Count searches performed
-    search_count = sum(
-        1 for m in messages 
-        if hasattr(m, 'tool_calls') and m.tool_calls and
-        any(tc.get('name') == 'tavily_search' for tc in m.tool_calls)
-    )
+    # Workflow bookkeeping is maintained incrementally by tool_node, so each
+    # turn reads O(1) state instead of re-scanning the whole message history
+    research_question = state.get("research_question", "")
+    if not research_question:
+        # First turn: cache the research question from the first HumanMessage
+        research_question = next(
+            (msg.content for msg in messages if isinstance(msg, HumanMessage)), ""
+        )
 
-    # Check if think_tool was used recently (last 2 messages)
-    recent_messages = messages[-2:] if len(messages) >= 2 else messages
-    has_recent_thought = any(
-        hasattr(m, 'tool_calls') and m.tool_calls and
-        any(tc.get('name') == 'think_tool' for tc in m.tool_calls)
-        for m in recent_messages
-    )
+    search_count = state.get("search_count", 0)
+    if not search_count:
+        # Counters may be unseeded (state resumed or seeded externally);
+        # derive from the compact SoA array of tool-call name tuples rather
+        # than attribute-walking the message objects
+        search_count = sum(
+            "tavily_search" in names for names in state.get("tool_call_names", [])
+        )
+    has_recent_thought = state.get("last_tool_name", "") == "think_tool"
 
     # Build explicit workflow instructions based on state
     if search_count == 0:
@@ -113,51 +172,103 @@ def llm_call(state: ResearcherState):
     else:
         next_step = "**NEXT ACTION:** Based on your reflection, either: (1) Call tavily_search if you need more info, OR (2) Provide your final answer if you have enough."
 
-    system_content = f"""{research_agent_prompt.format(date=get_today_str())}
+    # Keep the expensive static content (agent prompt + research question) as a
+    # byte-identical prefix turn-to-turn so llama.cpp can reuse its KV cache;
+    # volatile workflow state goes in a trailing block only.
+    system_content = f"""{format_prompt_with_date(research_agent_prompt)}
 
 **RESEARCH QUESTION:**
 {research_question}
 
-**PROGRESS:** {search_count}/5 searches completed
+CRITICAL: Make tool calls. Do NOT write explanations.
 
-{next_step}
+**PROGRESS:** {search_count}/5 searches completed
 
-CRITICAL: Make tool calls. Do NOT write explanations."""
+{next_step}"""
 
     # KEY FIX: Convert ToolMessage to HumanMessage format
     # LFM2 only reliably calls tools in response to HumanMessages (proven in tests)
     if messages:
         last_msg = messages[-1]
-        if isinstance(last_msg, ToolMessage):
-            # Convert ToolMessage content to HumanMessage so LFM2 treats it as a request
-            pruned_messages = [HumanMessage(content=last_msg.content)]
-        elif isinstance(last_msg, HumanMessage):
-            pruned_messages = [last_msg]
-        else:
-            # For other message types, wrap content as HumanMessage
-            pruned_messages = [HumanMessage(content=str(getattr(last_msg, 'content', '')))]
+        pruned_messages = [_PRUNE_DISPATCH.get(type(last_msg), _rewrap_as_human)(last_msg)]
     else:
         pruned_messages = []
 
+    # Check the response cache before paying for an LFM2 call
+    cache_key = _llm_cache.make_key(
+        system_content, [m.content for m in pruned_messages], tools_by_name
+    )
+    response = _llm_cache.get(cache_key) if _llm_cache_enabled else None
+    if response is None:
+        response = model_with_tools.invoke(
+            [SystemMessage(content=system_content)] + pruned_messages
+        )
+        if _llm_cache_enabled:
+            _llm_cache.set(cache_key, response)
+
+    # FAST PATH: think_tool is a pure echo with no external I/O. When it's the
+    # only tool called, execute it inline and skip the tool_node graph step
+    # (and its extra state round-trip) entirely - should_continue routes the
+    # trailing ToolMessage straight back here.
+    tool_calls = getattr(response, "tool_calls", None)
+    if tool_calls:
+        # Intern names on receipt so downstream comparisons are pointer checks
+        for tc in tool_calls:
+            tc["name"] = sys.intern(tc["name"])
+    if tool_calls and all(tc["name"] is _THINK_TOOL for tc in tool_calls):
+        new_messages = [response]
+        for tool_call in tool_calls:
+            observation = think_tool.invoke(tool_call["args"])
+            new_messages.append(
+                ToolMessage(
+                    content=observation,
+                    name=tool_call["name"],
+                    tool_call_id=tool_call["id"]
+                )
+            )
+        return {
+            "researcher_messages": new_messages,
+            "research_question": research_question,
+            "last_tool_name": "think_tool",
+            "tool_call_names": [tuple(tc["name"] for tc in tool_calls)] + [()] * len(tool_calls),
+        }
+
     return {
-        "researcher_messages": [
-            model_with_tools.invoke([SystemMessage(content=system_content)] + pruned_messages)
-        ]
+        "researcher_messages": [response],
+        "research_question": research_question,
+        "tool_call_names": [tuple(tc["name"] for tc in tool_calls) if tool_calls else ()],
     }
 
-def tool_node(state: ResearcherState):
+async def tool_node(state: ResearcherState):
     """Execute all tool calls from the previous LLM response.
 
-    Executes all tool calls from the previous LLM responses.
+    Executes all tool calls from the previous LLM responses concurrently -
+    the calls are independent I/O, so total latency is the slowest call
+    rather than the sum of all calls.
     Returns updated state with tool execution results.
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
 
-    # Execute all tool calls
-    observations = []
+    # Intern names on receipt so downstream comparisons are pointer checks
     for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
+        tool_call["name"] = sys.intern(tool_call["name"])
+
+    async def execute_tool(tool_call):
+        """Run a single tool call, pushing the sync tool to a worker thread."""
+        # Specialized dispatch for the two hot tool names; the generic dict
+        # lookup stays as a fallback for anything else
+        name = tool_call["name"]
+        if name is _TAVILY_SEARCH:
+            return await asyncio.to_thread(tavily_search.invoke, tool_call["args"])
+        if name is _THINK_TOOL:
+            return await asyncio.to_thread(think_tool.invoke, tool_call["args"])
+        return await asyncio.to_thread(tools_by_name[name].invoke, tool_call["args"])
+
+    # Execute all tool calls concurrently (gather preserves input order,
+    # so observations stay aligned with tool_calls)
+    observations = await asyncio.gather(
+        *(execute_tool(tool_call) for tool_call in tool_calls)
+    )
 
     # Create tool message outputs
     tool_outputs = [
@@ -168,35 +279,82 @@ def tool_node(state: ResearcherState):
         ) for observation, tool_call in zip(observations, tool_calls)
     ]
 
-    return {"researcher_messages": tool_outputs}
+    # Update the incremental workflow counters consumed by llm_call
+    executed_names = [tool_call["name"] for tool_call in tool_calls]
+
+    return {
+        "researcher_messages": tool_outputs,
+        "tool_blobs": _truncate_tool_outputs(tool_outputs),
+        "search_count": state.get("search_count", 0) + executed_names.count("tavily_search"),
+        "last_tool_name": executed_names[-1] if executed_names else state.get("last_tool_name", ""),
+        "tool_call_names": [()] * len(tool_outputs),
+    }
 
 def compress_research(state: ResearcherState) -> dict:
     """Compress research findings into a concise summary.
 
     Takes all the research messages and tool outputs and creates
     a compressed summary suitable for the supervisor's decision-making.
+
+    Long tool outputs are extractively pruned to a token budget before the
+    LFM2 invoke so prefill cost stays bounded on the 32K window.
     """
 
-    system_message = compress_research_system_prompt.format(date=get_today_str())
-    messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
-    response = compress_model.invoke(messages)
+    system_message = format_prompt_with_date(compress_research_system_prompt)
+    research_question = state.get("research_question", "")
+
+    # Prune long tool outputs against the research question before invoking
+    pruned_history = prune_messages_for_compression(
+        state.get("researcher_messages", []), research_question
+    )
+
+    # Repeat the research question at both ends of the context to counter
+    # lost-in-the-middle position effects
+    human_content = compress_research_human_message
+    if research_question:
+        system_message = f"{system_message}\n\n**RESEARCH QUESTION:**\n{research_question}"
+        human_content = f"**RESEARCH QUESTION:**\n{research_question}\n\n{compress_research_human_message}"
 
-    # Extract raw notes from tool and AI messages
-    raw_notes = [
-        str(m.content) for m in filter_messages(
-            state["researcher_messages"], 
-            include_types=["tool", "ai"]
+    messages = [SystemMessage(content=system_message)] + pruned_history + [HumanMessage(content=human_content)]
+
+    # Run the raw-notes join in a worker thread while the compression model
+    # streams, so the Python-side string work overlaps with LLM generation
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        raw_notes_future = executor.submit(
+            _join_raw_notes, state["researcher_messages"], state.get("tool_blobs", {})
         )
-    ]
+        response_chunks = [chunk.content for chunk in compress_model.stream(messages)]
+        raw_notes_text = raw_notes_future.result()
 
     return {
-        "compressed_research": str(response.content),
-        "raw_notes": ["\n".join(raw_notes)]
+        "compressed_research": "".join(str(chunk) for chunk in response_chunks),
+        "raw_notes": [raw_notes_text]
     }
 
+def _join_raw_notes(messages, tool_blobs=None) -> str:
+    """Join tool and AI message contents into a single raw-notes blob.
+
+    Truncated tool results are restored from the tool_blobs side table so the
+    raw notes keep full fidelity. Joins over a generator so long tool outputs
+    aren't materialized as an intermediate list, and skips the str() copy when
+    content is already a string.
+    """
+    blobs = tool_blobs or {}
+
+    def full_content(message):
+        blob = blobs.get(getattr(message, "tool_call_id", None))
+        if blob is not None:
+            return blob
+        return message.content if isinstance(message.content, str) else str(message.content)
+
+    return "\n".join(
+        full_content(m)
+        for m in filter_messages(messages, include_types=["tool", "ai"])
+    )
+
 # ===== ROUTING LOGIC =====
 
-def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_research"]:
+def should_continue(state: ResearcherState) -> Literal["tool_node", "llm_call", "compress_research"]:
     """Determine whether to continue research or provide final answer.
 
     Determines whether the agent should continue the research loop or provide
@@ -204,11 +362,16 @@ def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_re
 
     Returns:
         "tool_node": Continue to tool execution
+        "llm_call": Re-enter llm_call directly (inlined think_tool fast path)
         "compress_research": Stop and compress research
     """
     messages = state["researcher_messages"]
     last_message = messages[-1]
 
+    # An inlined think_tool leaves a ToolMessage last - loop straight back
+    # to llm_call without going through tool_node
+    if isinstance(last_message, ToolMessage):
+        return "llm_call"
     # If the LLM makes a tool call, continue to tool execution
     if last_message.tool_calls:
         return "tool_node"
@@ -232,6 +395,7 @@ agent_builder.add_conditional_edges(
     should_continue,
     {
         "tool_node": "tool_node", # Continue research loop
+        "llm_call": "llm_call", # Inlined think_tool - skip tool_node
         "compress_research": "compress_research", # Provide final answer
     },
 )
@@ -15,8 +15,10 @@ Key features:
 - Message pruning for LFM2 compatibility (keeps 2-message context for tool calling)
 """
 
+import asyncio
 import os
 import re
+import sys
 
 from typing_extensions import Literal
 
@@ -28,7 +30,7 @@ from langgraph.graph import StateGraph, START, END
 
 from deep_research_from_scratch.prompts import research_agent_prompt_with_mcp, compress_research_system_prompt, compress_research_human_message
 from deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState
-from deep_research_from_scratch.utils import get_today_str, think_tool, get_current_dir
+from deep_research_from_scratch.utils import LLMCache, format_prompt_with_date, think_tool, get_current_dir, prune_messages_for_compression, shared_http_client, shared_http_async_client
 
 # ===== CONFIGURATION =====
 
@@ -48,6 +50,12 @@ mcp_config = {
 # Global client variable - will be initialized lazily
 _client = None
 
+# Cached MCP tool snapshot - the filesystem server's tool list is stable after
+# boot, so fetch it once instead of a stdio round-trip on every graph step
+_mcp_tools_cache = None
+_mcp_tools_by_name_cache = None
+_executable_tools_by_name_cache = None
+
 def get_mcp_client():
     """Get or initialize MCP client lazily to avoid issues with LangGraph Platform."""
     global _client
@@ -55,6 +63,21 @@ def get_mcp_client():
         _client = MultiServerMCPClient(mcp_config)
     return _client
 
+async def get_mcp_tools_cached():
+    """Get MCP tools, fetching from the server only on the first call."""
+    global _mcp_tools_cache
+    if _mcp_tools_cache is None:
+        _mcp_tools_cache = await get_mcp_client().get_tools()
+    return _mcp_tools_cache
+
+async def get_mcp_tools_by_name_cached():
+    """Get the name -> tool mapping for the cached MCP tool snapshot."""
+    global _mcp_tools_by_name_cache
+    if _mcp_tools_by_name_cache is None:
+        mcp_tools = await get_mcp_tools_cached()
+        _mcp_tools_by_name_cache = {tool.name: tool for tool in mcp_tools}
+    return _mcp_tools_by_name_cache
+
 # Initialize models - using dual LFM2 setup
 # Compression model uses base LFM2 on port 8081 for plain text generation
 compress_model = init_chat_model(
@@ -64,6 +87,8 @@ compress_model = init_chat_model(
     api_key="sk-no-key",
     temperature=0.2,
     max_tokens=32000,
+    http_client=shared_http_client,
+    http_async_client=shared_http_async_client,
 )
 
 # Main research model uses LFM2-Tool on port 8080 for tool calling
@@ -73,19 +98,43 @@ model = init_chat_model(
     base_url="http://localhost:8080/v1",
     api_key="sk-no-key",
     temperature=0,
+    http_client=shared_http_client,
+    http_async_client=shared_http_async_client,
 )
 
+# Cache model responses keyed on (system prompt, pruned messages, tool names).
+# Only safe at low temperature, where repeated inputs give identical outputs.
+_llm_cache = LLMCache()
+_llm_cache_enabled = (getattr(model, "temperature", None) or 0) <= 0.2
+
+# Cached tool binding - bind_tools re-serializes every tool JSON schema, and
+# the tool list is stable once the MCP server has booted, so rebind only when
+# the tool names actually change
+_model_with_tools = None
+_model_with_tools_key = None
+
+def bind_tools_cached(tools):
+    """Bind tools to the model, reusing the binding while the tool set is stable."""
+    global _model_with_tools, _model_with_tools_key
+    tools_key = tuple(tool.name for tool in tools)
+    if _model_with_tools is None or _model_with_tools_key != tools_key:
+        _model_with_tools = model.bind_tools(tools)
+        _model_with_tools_key = tools_key
+    return _model_with_tools
+
 # ===== COMPOSITE TOOLS =====
 
+# Precompiled parsers for MCP filesystem tool output
+_PATH_RE = re.compile(r'/[^\n]+')            # absolute paths in list_allowed_directories output
+_FILE_RE = re.compile(r'^\[FILE\]\s+(.+?)\s*$', re.MULTILINE)  # filenames in list_directory output
+
 async def list_all_available_files_impl() -> str:
     """Composite tool that lists all available files in one operation.
 
     Combines list_allowed_directories + list_directory into a single tool call,
     reducing the number of sequential decisions the LLM needs to make.
     """
-    client = get_mcp_client()
-    mcp_tools = await client.get_tools()
-    tools_by_name = {tool.name: tool for tool in mcp_tools}
+    tools_by_name = await get_mcp_tools_by_name_cached()
 
     # Get allowed directories
     list_dirs_tool = tools_by_name.get("list_allowed_directories")
@@ -95,7 +144,7 @@ async def list_all_available_files_impl() -> str:
     dirs_result = await list_dirs_tool.ainvoke({})
 
     # Parse the directories (result is a string like "Allowed directories:\n/path/to/files")
-    paths = re.findall(r'/[^\n]+', str(dirs_result))
+    paths = _PATH_RE.findall(str(dirs_result))
 
     if not paths:
         return "No directories found"
@@ -105,26 +154,31 @@ async def list_all_available_files_impl() -> str:
     if not list_dir_tool:
         return f"Allowed directories: {paths[0]}\n(list_directory tool not available)"
 
+    # List all directories concurrently - the calls are independent, so total
+    # latency is the slowest single list_directory instead of the sum
+    results = await asyncio.gather(
+        *(list_dir_tool.ainvoke({"path": path}) for path in paths),
+        return_exceptions=True,
+    )
+
     all_files = []
-    for path in paths:
-        try:
-            files_result = await list_dir_tool.ainvoke({"path": path})
-            # Parse file names and build full paths so LFM2 can copy exact paths
-            # files_result format: "[FILE] filename.ext\n[FILE] other.ext"
-            file_entries = []
-            for line in str(files_result).split('\n'):
-                if '[FILE]' in line:
-                    filename = line.replace('[FILE]', '').strip()
-                    if filename:
-                        full_path = f"{path}/{filename}"
-                        file_entries.append(f"  - {filename} (FULL_PATH: {full_path})")
-
-            if file_entries:
-                all_files.append(f"\nDirectory: {path}\nFiles:\n" + "\n".join(file_entries))
-            else:
-                all_files.append(f"\nDirectory: {path}\nFiles: {files_result}")
-        except Exception as e:
-            all_files.append(f"\nDirectory: {path}\nError: {str(e)}")
+    for path, files_result in zip(paths, results):
+        if isinstance(files_result, Exception):
+            all_files.append(f"\nDirectory: {path}\nError: {str(files_result)}")
+            continue
+
+        # Parse file names and build full paths so LFM2 can copy exact paths
+        # files_result format: "[FILE] filename.ext\n[FILE] other.ext"
+        # Single multiline-regex pass instead of per-line split/replace/strip
+        file_entries = [
+            f"  - {filename} (FULL_PATH: {path}/{filename})"
+            for filename in _FILE_RE.findall(str(files_result))
+        ]
+
+        if file_entries:
+            all_files.append(f"\nDirectory: {path}\nFiles:\n" + "\n".join(file_entries))
+        else:
+            all_files.append(f"\nDirectory: {path}\nFiles: {files_result}")
 
     return "".join(all_files)
 
@@ -142,8 +196,56 @@ async def list_all_files() -> str:
     """
     return await list_all_available_files_impl()
 
+# Tool results longer than this are stored out-of-band in state["tool_blobs"]
+# and replaced with a truncated preview in the message history
+TOOL_BLOB_THRESHOLD = 6000
+
+# Interned tool-name constants. Tool-call names are interned on receipt from
+# the model, so hot-path comparisons against these become pointer checks
+# ('is') instead of byte-by-byte string compares.
+_THINK_TOOL = sys.intern("think_tool")
+_LIST_ALL_FILES = sys.intern("list_all_files")
+_READ_FILE = sys.intern("read_file")
+_READ_TEXT_FILE = sys.intern("read_text_file")
+
 # ===== AGENT NODES =====
 
+def _truncate_tool_outputs(tool_outputs):
+    """Move oversized tool-result content into an out-of-band blob dict.
+
+    ToolMessages over TOOL_BLOB_THRESHOLD chars keep only a truncated preview;
+    the full content is returned keyed by tool_call_id so compress_research
+    can still recover it, while per-turn checkpoint serialization and message
+    scans stay bounded.
+    """
+    tool_blobs = {}
+    for tool_output in tool_outputs:
+        content = tool_output.content
+        if isinstance(content, str) and len(content) > TOOL_BLOB_THRESHOLD:
+            tool_blobs[tool_output.tool_call_id] = content
+            tool_output.content = (
+                content[:TOOL_BLOB_THRESHOLD]
+                + f"\n... <truncated {len(content) - TOOL_BLOB_THRESHOLD} chars; "
+                f"full result kept for final notes>"
+            )
+    return tool_blobs
+
+def _rewrap_as_human(message) -> HumanMessage:
+    """Rewrap a message's content as a HumanMessage, copying only if needed."""
+    content = getattr(message, 'content', '')
+    if not isinstance(content, str):
+        content = str(content)
+    return HumanMessage(content=content)
+
+# Last-message pruning dispatch keyed on concrete message type: HumanMessages
+# pass through untouched, everything else gets rewrapped (LFM2 only reliably
+# calls tools in response to HumanMessages). Replaces an isinstance ladder on
+# the hot path with a single dict lookup.
+_PRUNE_DISPATCH = {
+    HumanMessage: lambda message: message,
+    ToolMessage: _rewrap_as_human,
+}
+
 async def llm_call(state: ResearcherState):
     """Analyze current state and decide on tool usage with MCP integration.
 
@@ -155,44 +257,35 @@ async def llm_call(state: ResearcherState):
 
     Returns updated state with model response.
     """
-    # Get available tools from MCP server
-    client = get_mcp_client()
-    mcp_tools = await client.get_tools()
-
-    # Create simplified tool set to reduce cognitive load on LFM2
-    read_file_tool = next((t for t in mcp_tools if t.name in ["read_file", "read_text_file"]), None)
-
-    if read_file_tool:
-        tools = [list_all_files, read_file_tool, think_tool]
-    else:
-        # Fallback to all MCP tools if read_file not found
-        tools = [list_all_files] + mcp_tools + [think_tool]
-
-    # Initialize model with tool binding
-    model_with_tools = model.bind_tools(tools)
+    # Kick off the MCP tool fetch now and await it only when the tool set is
+    # needed - the Python-side bookkeeping below overlaps with the stdio
+    # round-trip on a cold cache
+    tools_task = asyncio.create_task(get_mcp_tools_cached())
 
     # MESSAGE PRUNING + WORKFLOW STATE FOR LFM2
     # Critical: LFM2 only calls tools in response to HumanMessages, not ToolMessages
     messages = state["researcher_messages"]
 
-    # Extract research question
-    research_question = ""
-    for msg in messages:
-        if isinstance(msg, HumanMessage):
-            research_question = msg.content
-            break
-
-    # Determine workflow state based on tool calls made
-    has_listed = any(
-        hasattr(m, 'tool_calls') and m.tool_calls and 
-        any(tc.get('name') == 'list_all_files' for tc in m.tool_calls) 
-        for m in messages
-    )
-    has_read = any(
-        hasattr(m, 'tool_calls') and m.tool_calls and 
-        any(tc.get('name') in ['read_file', 'read_text_file'] for tc in m.tool_calls)
-        for m in messages
-    )
+    # Workflow bookkeeping is maintained incrementally by tool_node, so each
+    # turn reads O(1) state instead of re-scanning the whole message history
+    research_question = state.get("research_question", "")
+    if not research_question:
+        # First turn: cache the research question from the first HumanMessage
+        research_question = next(
+            (msg.content for msg in messages if isinstance(msg, HumanMessage)), ""
+        )
+
+    has_listed = state.get("has_listed", False)
+    has_read = state.get("has_read", False)
+    if not (has_listed and has_read):
+        # Flags may be unseeded (state resumed or seeded externally); derive
+        # from the compact SoA array of tool-call name tuples rather than
+        # attribute-walking the message objects
+        tool_call_names = state.get("tool_call_names", [])
+        has_listed = has_listed or any("list_all_files" in names for names in tool_call_names)
+        has_read = has_read or any(
+            "read_file" in names or "read_text_file" in names for names in tool_call_names
+        )
 
     # Build explicit workflow instructions based on state
     if not has_listed:
@@ -202,34 +295,63 @@ async def llm_call(state: ResearcherState):
     else:
         next_step = "**NEXT ACTION:** You have read the file. Provide your final research answer."
 
-    system_content = f"""{research_agent_prompt_with_mcp.format(date=get_today_str())}
+    # Keep the expensive static content (agent prompt + research question) as a
+    # byte-identical prefix turn-to-turn so llama.cpp can reuse its KV cache;
+    # the volatile next_step instruction goes in a trailing block only.
+    system_content = f"""{format_prompt_with_date(research_agent_prompt_with_mcp)}
 
 **RESEARCH QUESTION:**
 {research_question}
 
-{next_step}
+CRITICAL: Make tool calls. Do NOT write explanations.
 
-CRITICAL: Make tool calls. Do NOT write explanations."""
+{next_step}"""
 
     # KEY FIX: Convert ToolMessage to HumanMessage format
     # LFM2 only reliably calls tools in response to HumanMessages (proven in tests)
     if messages:
         last_msg = messages[-1]
-        if isinstance(last_msg, ToolMessage):
-            # Convert ToolMessage content to HumanMessage so LFM2 treats it as a request
-            pruned_messages = [HumanMessage(content=last_msg.content)]
-        elif isinstance(last_msg, HumanMessage):
-            pruned_messages = [last_msg]
-        else:
-            # For other message types, wrap content as HumanMessage
-            pruned_messages = [HumanMessage(content=str(getattr(last_msg, 'content', '')))]
+        pruned_messages = [_PRUNE_DISPATCH.get(type(last_msg), _rewrap_as_human)(last_msg)]
     else:
         pruned_messages = []
 
+    # Bookkeeping done - collect the MCP tools fetched concurrently above
+    mcp_tools = await tools_task
+
+    # Create simplified tool set to reduce cognitive load on LFM2
+    read_file_tool = next((t for t in mcp_tools if t.name in ["read_file", "read_text_file"]), None)
+
+    if read_file_tool:
+        tools = [list_all_files, read_file_tool, think_tool]
+    else:
+        # Fallback to all MCP tools if read_file not found
+        tools = [list_all_files] + mcp_tools + [think_tool]
+
+    # Initialize model with tool binding (reused across turns)
+    model_with_tools = bind_tools_cached(tools)
+
+    # Check the response cache before paying for an LFM2 call
+    cache_key = _llm_cache.make_key(
+        system_content, [m.content for m in pruned_messages], [t.name for t in tools]
+    )
+    response = _llm_cache.get(cache_key) if _llm_cache_enabled else None
+    if response is None:
+        # ainvoke keeps the event loop free - a sync invoke here would block
+        # asyncio and prevent concurrent tool execution from being scheduled
+        response = await model_with_tools.ainvoke(
+            [SystemMessage(content=system_content)] + pruned_messages
+        )
+        if _llm_cache_enabled:
+            _llm_cache.set(cache_key, response)
+
+    response_tool_calls = getattr(response, "tool_calls", None)
+
     return {
-        "researcher_messages": [
-            model_with_tools.invoke([SystemMessage(content=system_content)] + pruned_messages)
-        ]
+        "researcher_messages": [response],
+        "research_question": research_question,
+        "tool_call_names": [
+            tuple(tc["name"] for tc in response_tool_calls) if response_tool_calls else ()
+        ],
     }
 
 async def tool_node(state: ResearcherState):
@@ -245,25 +367,34 @@ async def tool_node(state: ResearcherState):
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
 
+    # Intern names on receipt so downstream comparisons are pointer checks
+    for tool_call in tool_calls:
+        tool_call["name"] = sys.intern(tool_call["name"])
+
     async def execute_tools():
         """Execute all tool calls. MCP tools require async execution."""
-        # Get fresh tool references from MCP server
-        client = get_mcp_client()
-        mcp_tools = await client.get_tools()
-        tools = [list_all_files] + mcp_tools + [think_tool]
-        tools_by_name = {tool.name: tool for tool in tools}
-
-        # Execute tool calls (sequentially for reliability)
-        observations = []
-        for tool_call in tool_calls:
+        # Get executable tool references, building the mapping only once
+        global _executable_tools_by_name_cache
+        if _executable_tools_by_name_cache is None:
+            mcp_tools = await get_mcp_tools_cached()
+            tools = [list_all_files] + mcp_tools + [think_tool]
+            _executable_tools_by_name_cache = {tool.name: tool for tool in tools}
+        tools_by_name = _executable_tools_by_name_cache
+
+        async def run_tool_call(tool_call):
+            """Run a single tool call, wrapping sync tools for the event loop."""
             tool = tools_by_name[tool_call["name"]]
-            if tool_call["name"] == "think_tool":
-                # think_tool is sync, use regular invoke
-                observation = tool.invoke(tool_call["args"])
-            else:
-                # MCP tools are async, use ainvoke
-                observation = await tool.ainvoke(tool_call["args"])
-            observations.append(observation)
+            if tool_call["name"] is _THINK_TOOL:
+                # think_tool is sync, push it to a worker thread
+                return await asyncio.to_thread(tool.invoke, tool_call["args"])
+            # MCP tools are async, use ainvoke
+            return await tool.ainvoke(tool_call["args"])
+
+        # Execute tool calls concurrently - the calls are independent, and
+        # gather keeps observations aligned with tool_calls
+        observations = await asyncio.gather(
+            *(run_tool_call(tool_call) for tool_call in tool_calls)
+        )
 
         # Format results as tool messages
         tool_outputs = [
@@ -279,9 +410,19 @@ async def tool_node(state: ResearcherState):
 
     messages = await execute_tools()
 
-    return {"researcher_messages": messages}
+    # Update the incremental workflow flags consumed by llm_call
+    executed_names = {tool_call["name"] for tool_call in tool_calls}
 
-def compress_research(state: ResearcherState) -> dict:
+    return {
+        "researcher_messages": messages,
+        "tool_blobs": _truncate_tool_outputs(messages),
+        "has_listed": state.get("has_listed", False) or _LIST_ALL_FILES in executed_names,
+        "has_read": state.get("has_read", False) or bool(executed_names & {_READ_FILE, _READ_TEXT_FILE}),
+        "last_tool_name": tool_calls[-1]["name"] if tool_calls else state.get("last_tool_name", ""),
+        "tool_call_names": [()] * len(messages),
+    }
+
+async def compress_research(state: ResearcherState) -> dict:
     """Compress research findings into a concise summary.
 
     Takes all the research messages and tool outputs and creates
@@ -289,26 +430,68 @@ def compress_research(state: ResearcherState) -> dict:
 
     This function filters out think_tool calls and focuses on substantive
     file-based research content from MCP tools.
+
+    Long tool outputs are extractively pruned to a token budget before the
+    LFM2 invoke so prefill cost stays bounded on the 32K window.
     """
 
-    system_message = compress_research_system_prompt.format(date=get_today_str())
-    messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
+    system_message = format_prompt_with_date(compress_research_system_prompt)
+    research_question = state.get("research_question", "")
 
-    response = compress_model.invoke(messages)
+    # Prune long tool outputs against the research question before invoking
+    pruned_history = prune_messages_for_compression(
+        state.get("researcher_messages", []), research_question
+    )
+
+    # Repeat the research question at both ends of the context to counter
+    # lost-in-the-middle position effects
+    human_content = compress_research_human_message
+    if research_question:
+        system_message = f"{system_message}\n\n**RESEARCH QUESTION:**\n{research_question}"
+        human_content = f"**RESEARCH QUESTION:**\n{research_question}\n\n{compress_research_human_message}"
 
-    # Extract raw notes from tool and AI messages
-    raw_notes = [
-        str(m.content) for m in filter_messages(
-            state["researcher_messages"], 
-            include_types=["tool", "ai"]
+    messages = [SystemMessage(content=system_message)] + pruned_history + [HumanMessage(content=human_content)]
+
+    # Run the raw-notes join in a worker thread while the compression model
+    # streams, so the Python-side string work overlaps with LLM generation
+    raw_notes_task = asyncio.create_task(
+        asyncio.to_thread(
+            _join_raw_notes, state["researcher_messages"], state.get("tool_blobs", {})
         )
-    ]
+    )
+
+    response_chunks = []
+    async for chunk in compress_model.astream(messages):
+        response_chunks.append(chunk.content)
+
+    raw_notes_text = await raw_notes_task
 
     return {
-        "compressed_research": str(response.content),
-        "raw_notes": ["\n".join(raw_notes)]
+        "compressed_research": "".join(str(chunk) for chunk in response_chunks),
+        "raw_notes": [raw_notes_text]
     }
 
+def _join_raw_notes(messages, tool_blobs=None) -> str:
+    """Join tool and AI message contents into a single raw-notes blob.
+
+    Truncated tool results are restored from the tool_blobs side table so the
+    raw notes keep full fidelity. Joins over a generator so long tool outputs
+    aren't materialized as an intermediate list, and skips the str() copy when
+    content is already a string.
+    """
+    blobs = tool_blobs or {}
+
+    def full_content(message):
+        blob = blobs.get(getattr(message, "tool_call_id", None))
+        if blob is not None:
+            return blob
+        return message.content if isinstance(message.content, str) else str(message.content)
+
+    return "\n".join(
+        full_content(m)
+        for m in filter_messages(messages, include_types=["tool", "ai"])
+    )
+
 # ===== ROUTING LOGIC =====
 
 def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_research"]:
@@ -21,12 +21,35 @@ class ResearcherState(TypedDict):
     This state tracks the researcher's conversation, iteration count for limiting
     tool calls, the research topic being investigated, compressed findings,
     and raw research notes for detailed analysis.
+
+    It also carries incrementally maintained workflow bookkeeping (cached
+    research question, search count, last executed tool, file-listing/reading
+    flags) updated by tool_node so llm_call doesn't re-scan the full message
+    history every turn.
+
+    tool_call_names is a compact structure-of-arrays companion to
+    researcher_messages holding one tuple of tool-call names per message
+    appended by the agent's own nodes (seed messages passed in by the
+    caller are not mirrored, so it is bookkeeping over agent turns, not a
+    full index). Workflow detection over it is a linear scan of small
+    tuples instead of attribute walks over message objects.
+
+    tool_blobs stores oversized tool results out-of-band, keyed by
+    tool_call_id; the corresponding ToolMessages carry only a truncated
+    preview so per-turn checkpoint serialization stays bounded.
     """
     researcher_messages: Annotated[Sequence[BaseMessage], add_messages]
     tool_call_iterations: int
     research_topic: str
     compressed_research: str
     raw_notes: Annotated[List[str], operator.add]
+    research_question: str
+    search_count: int
+    last_tool_name: str
+    has_listed: bool
+    has_read: bool
+    tool_call_names: Annotated[List[tuple], operator.add]
+    tool_blobs: Annotated[dict, operator.or_]
 
 class ResearcherOutputState(TypedDict):
     """
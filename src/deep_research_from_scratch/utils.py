@@ -5,12 +5,19 @@ This module provides search and content processing utilities for the research ag
 including web search capabilities and content summarization tools.
 """
 
+import hashlib
+import json
+import re
+import uuid
+
 from pathlib import Path
 from datetime import datetime
 from typing_extensions import Annotated, List, Literal
 
-from langchain.chat_models import init_chat_model 
-from langchain_core.messages import HumanMessage
+import httpx
+
+from langchain.chat_models import init_chat_model
+from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool, InjectedToolArg
 from tavily import TavilyClient
@@ -24,6 +31,32 @@ def get_today_str() -> str:
     """Get current date in a human-readable format."""
     return datetime.now().strftime("%a %b %-d, %Y")
 
+# Formatted-prompt cache: template -> (date, formatted). Prompt templates only
+# embed the date, which changes once per day, so re-running str.format on the
+# long templates every llm_call is wasted work.
+_formatted_prompts: dict = {}
+
+def format_prompt_with_date(prompt_template: str) -> str:
+    """Format a prompt template's {date} placeholder, caching per day.
+
+    Repeated calls reuse the formatted string until the date rolls over, so
+    long-running processes still pick up the new date.
+
+    Args:
+        prompt_template: Prompt template with a {date} placeholder
+
+    Returns:
+        The formatted prompt
+    """
+    today = get_today_str()
+    cached = _formatted_prompts.get(prompt_template)
+    if cached is not None and cached[0] == today:
+        return cached[1]
+
+    formatted = prompt_template.format(date=today)
+    _formatted_prompts[prompt_template] = (today, formatted)
+    return formatted
+
 def get_current_dir() -> Path:
     """Get the current directory of the module.
 
@@ -37,8 +70,172 @@ def get_current_dir() -> Path:
     except NameError:  # __file__ is not defined
         return Path.cwd()
 
+# ===== CONTEXT PRUNING =====
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+def estimate_tokens(text: str) -> int:
+    """Estimate token count cheaply (roughly 4 characters per token)."""
+    return len(text) // 4
+
+def prune_content_to_budget(content: str, research_question: str, max_tokens: int) -> str:
+    """Prune long content extractively down to a token budget.
+
+    Splits content into sentences, scores each by keyword overlap with the
+    research question, and keeps the highest-scoring sentences (in original
+    order) until the budget is exhausted. Keeps LFM2 prefill cost bounded and
+    mitigates lost-in-the-middle degradation on long tool outputs.
+
+    Args:
+        content: Text to prune
+        research_question: Question used for relevance scoring
+        max_tokens: Approximate token budget for the pruned text
+
+    Returns:
+        Pruned text within the token budget
+    """
+    if estimate_tokens(content) <= max_tokens:
+        return content
+
+    question_words = set(_WORD_RE.findall(research_question.lower()))
+    sentences = [s for s in _SENTENCE_SPLIT_RE.split(content) if s.strip()]
+
+    def relevance(sentence: str) -> int:
+        return len(set(_WORD_RE.findall(sentence.lower())) & question_words)
+
+    # Rank sentences by question overlap, then keep as many as fit the budget
+    ranked = sorted(range(len(sentences)), key=lambda i: relevance(sentences[i]), reverse=True)
+    kept = set()
+    budget_used = 0
+    for idx in ranked:
+        sentence_tokens = estimate_tokens(sentences[idx]) + 1
+        if budget_used + sentence_tokens > max_tokens:
+            continue
+        kept.add(idx)
+        budget_used += sentence_tokens
+
+    # Reassemble in original order to preserve readability
+    return "\n".join(sentences[i] for i in sorted(kept))
+
+def prune_messages_for_compression(
+    messages,
+    research_question: str,
+    token_budget: int = 8000,
+    long_message_chars: int = 4000,
+):
+    """Prune researcher messages to a token budget before compression.
+
+    Messages whose content exceeds long_message_chars (typically tavily_search
+    results and file reads) are extractively pruned against the research
+    question; shorter messages pass through unchanged. The remaining budget is
+    split evenly across the long messages.
+
+    Args:
+        messages: Researcher message history
+        research_question: Question used for relevance scoring
+        token_budget: Approximate total token budget for all message content
+        long_message_chars: Content length above which a message gets pruned
+
+    Returns:
+        Message list with long contents pruned to budget
+    """
+    contents = [
+        m.content if isinstance(m.content, str) else str(m.content)
+        for m in messages
+    ]
+    long_indices = [i for i, c in enumerate(contents) if len(c) > long_message_chars]
+    if not long_indices:
+        return list(messages)
+
+    short_tokens = sum(
+        estimate_tokens(c) for i, c in enumerate(contents) if i not in long_indices
+    )
+    per_message_budget = max((token_budget - short_tokens) // len(long_indices), 256)
+
+    pruned = []
+    for i, message in enumerate(messages):
+        if i in long_indices:
+            pruned_content = prune_content_to_budget(
+                contents[i], research_question, per_message_budget
+            )
+            pruned.append(message.model_copy(update={"content": pruned_content}))
+        else:
+            pruned.append(message)
+
+    return pruned
+
+# ===== LLM RESPONSE CACHING =====
+
+class LLMCache:
+    """Deterministic in-memory cache for chat model responses.
+
+    At low temperature (<=0.2) repeated (system prompt, pruned messages, tools)
+    inputs produce effectively identical outputs, so development re-runs and
+    tests can skip the LFM2 round-trip entirely on a cache hit.
+    """
+
+    def __init__(self):
+        """Initialize an empty response cache."""
+        self._responses: dict = {}
+
+    @staticmethod
+    def make_key(system_content: str, message_contents: List[str], tool_names) -> str:
+        """Build a stable SHA256 key from the prompt inputs."""
+        payload = json.dumps(
+            {
+                "sys": system_content,
+                "msgs": list(message_contents),
+                "tools": sorted(tool_names),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> AIMessage | None:
+        """Reconstruct the cached AIMessage for key, or None on a miss.
+
+        The message is rebuilt with fresh identifiers: replaying the original
+        message id through the add_messages reducer would replace the earlier
+        occurrence instead of appending, and reused tool_call_ids would
+        collide in tool_blobs, which is keyed by tool_call_id.
+        """
+        cached = self._responses.get(key)
+        if cached is None:
+            return None
+
+        payload = dict(cached)
+        payload.pop("id", None)
+        id_map = {}
+        payload["tool_calls"] = [
+            {**tool_call, "id": id_map.setdefault(tool_call.get("id"), f"call_{uuid.uuid4().hex[:24]}")}
+            for tool_call in (payload.get("tool_calls") or [])
+        ]
+        # Keep the provider-format copy consistent with the regenerated ids
+        extra = payload.get("additional_kwargs")
+        if extra and extra.get("tool_calls"):
+            extra = dict(extra)
+            extra["tool_calls"] = [
+                {**tool_call, "id": id_map.get(tool_call.get("id"), tool_call.get("id"))}
+                for tool_call in extra["tool_calls"]
+            ]
+            payload["additional_kwargs"] = extra
+        return AIMessage(**payload)
+
+    def set(self, key: str, response) -> None:
+        """Serialize an AIMessage response into the cache."""
+        if isinstance(response, AIMessage):
+            self._responses[key] = response.model_dump(exclude={"type"})
+
 # ===== CONFIGURATION =====
 
+# Shared HTTP clients for the local LFM2 endpoints. Every chat model reuses
+# one keep-alive connection pool instead of building its own client, so
+# repeated calls across the research loop skip connection setup entirely.
+_http_limits = httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60)
+shared_http_client = httpx.Client(limits=_http_limits)
+shared_http_async_client = httpx.AsyncClient(limits=_http_limits)
+
 # Use base LFM2 model (port 8081) for summarization - better for plain text generation
 summarization_model = (
     init_chat_model(
@@ -47,16 +244,65 @@ summarization_model = (
         base_url="http://localhost:8081/v1",
         api_key="sk-no-key",
         temperature=0.2,
+        http_client=shared_http_client,
+        http_async_client=shared_http_async_client,
     )
     .bind(
         response_format={"type": "json_object"},
         max_tokens=1024,
-        extra_body={"cache_prompt": False}
+        extra_body={"cache_prompt": True}  # Let llama.cpp reuse the prompt prefix KV cache
     )
 )
 
 tavily_client = TavilyClient()
 
+# ===== SEARCH RESULT CACHING =====
+
+# Semantic cache for formatted search results. The agent issues up to 5
+# searches per run and near-duplicate queries ("coffee shops SF" vs "best
+# coffee shops in San Francisco") are common across iterations and re-runs;
+# a similarity hit skips the Tavily round-trip and summarization entirely.
+# Entries are keyed by (max_results, topic, query word set) so differently
+# parameterized calls never share results; insertion order doubles as FIFO
+# eviction order once the cache is full
+_search_cache: dict = {}
+_SEARCH_CACHE_SIMILARITY = 0.9
+_SEARCH_CACHE_MAX_ENTRIES = 128
+
+def _normalize_query(query: str) -> frozenset:
+    """Reduce a query to its set of lowercase word tokens."""
+    return frozenset(_WORD_RE.findall(query.lower()))
+
+def _find_cached_search(query: str, max_results: int, topic: str):
+    """Return cached results for query or a near-duplicate, else None.
+
+    Only entries fetched with the same max_results and topic are eligible;
+    similarity is Jaccard overlap between word sets - a lightweight,
+    dependency-free stand-in for embedding cosine similarity.
+    """
+    words = _normalize_query(query)
+    if not words:
+        return None
+
+    best_results = None
+    best_score = _SEARCH_CACHE_SIMILARITY
+    for (cached_max_results, cached_topic, cached_words), results in _search_cache.items():
+        if cached_max_results != max_results or cached_topic != topic:
+            continue
+        union = len(words | cached_words)
+        score = len(words & cached_words) / union if union else 0.0
+        if score >= best_score:
+            best_results = results
+            best_score = score
+
+    return best_results
+
+def _store_cached_search(query: str, max_results: int, topic: str, results: str) -> None:
+    """Cache formatted results, evicting the oldest entry once full."""
+    if len(_search_cache) >= _SEARCH_CACHE_MAX_ENTRIES:
+        _search_cache.pop(next(iter(_search_cache)))
+    _search_cache[(max_results, topic, _normalize_query(query))] = results
+
 # ===== SEARCH FUNCTIONS =====
 
 def tavily_search_multiple(
@@ -208,6 +454,11 @@ def tavily_search(
     Returns:
         Formatted string of search results with summaries
     """
+    # Return cached results for near-duplicate queries without the HTTP trip
+    cached_output = _find_cached_search(query, max_results, topic)
+    if cached_output is not None:
+        return cached_output
+
     # Execute search for single query
     search_results = tavily_search_multiple(
         [query],  # Convert single query to list for the internal function
@@ -222,8 +473,11 @@ def tavily_search(
     # Process results with summarization
     summarized_results = process_search_results(unique_results)
 
-    # Format output for consumption
-    return format_search_output(summarized_results)
+    # Format output for consumption and cache it for similar future queries
+    formatted_output = format_search_output(summarized_results)
+    _store_cached_search(query, max_results, topic, formatted_output)
+
+    return formatted_output
 
 @tool(parse_docstring=True)
 def think_tool(reflection: str) -> str:
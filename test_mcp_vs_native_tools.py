@@ -8,6 +8,13 @@ to LFM2's tool calling failures.
 """
 
 import asyncio
+import functools
+import io
+import json
+import mmap
+import os
+import re
+import sys
 from pathlib import Path
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
@@ -27,14 +34,49 @@ model = init_chat_model(
 current_dir = Path(__file__).parent
 test_file_path = current_dir / "src/deep_research_from_scratch/files/coffee_shops_sf.md"
 
+# Shared system prompt (minimal and explicit)
+MINIMAL_SYSTEM_PROMPT = """You have a read_file tool.
+
+CRITICAL: Your response MUST be ONLY a tool call. DO NOT write text.
+DO NOT say "I will read the file..."
+DO NOT explain what you're doing.
+ONLY call the read_file tool with the file path."""
+
+@functools.lru_cache(maxsize=64)
+def _read_cached(path: str, mtime_ns: int) -> str:
+    """LRU-bounded file contents keyed by (path, mtime).
+
+    Binary read + single decode skips the text I/O layer's chunked
+    decoding and newline translation, which is CPU-bound on large files.
+    Multi-MB files are mapped instead of read so the bytes aren't held
+    twice (page cache + an intermediate bytes object) during decode.
+    """
+    if os.stat(path).st_size > 1 << 20:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:].decode('utf-8', errors='replace')
+    return Path(path).read_bytes().decode('utf-8', errors='replace')
+
+def _read_text(path: str) -> str:
+    """Read a file as UTF-8 text, memoized until the file changes.
+
+    Repeat reads of the same unchanged path - common when the agent reads
+    a file multiple times in a session - are a dict lookup instead of disk
+    I/O; the mtime in the cache key invalidates stale entries naturally.
+    """
+    return _read_cached(path, os.stat(path).st_mtime_ns)
+
+async def _read_text_async(path: str) -> str:
+    """Thread-pool twin of _read_text so ainvoke never blocks the event loop."""
+    return await asyncio.to_thread(_read_text, path)
+
 # ========================================
 # NATIVE TOOL - MINIMAL
 # ========================================
 @tool
 def read_file_minimal(path: str) -> str:
     """Read a file."""
-    with open(path, 'r') as f:
-        return f.read()
+    return _read_text(path)
 
 # ========================================
 # NATIVE TOOL - VERBOSE (mimicking MCP)
@@ -58,213 +100,475 @@ def read_file_verbose(path: str) -> str:
         FileNotFoundError: If the specified file does not exist
         PermissionError: If the file cannot be read due to permissions
     """
-    with open(path, 'r') as f:
-        return f.read()
+    return _read_text(path)
 
-async def run_tests():
-    """Run comparison tests between MCP and native tools."""
+# ========================================
+# NATIVE TOOL - COMPACT (verbose semantics, minified form)
+# ========================================
+@tool
+def read_file_compact(path: str) -> str:
+    """Read file at absolute path. Args: path(str)->str. Raises: FileNotFoundError, PermissionError."""
+    return _read_text(path)
 
-    print("="*80)
-    print("MCP vs NATIVE TOOLS COMPARISON - CONTROLLED")
-    print("="*80)
-    print()
-    print("Testing whether MCP tool schemas bloat context compared to native tools")
-    print("Using IDENTICAL message structure for fair comparison")
-    print()
+# Lines worth keeping from the elided middle of a large file
+_ERROR_LINE_RE = re.compile(r"ERROR|FATAL|Exception|Traceback")
 
-    # Shared system prompt (minimal and explicit)
-    minimal_system_prompt = """You have a read_file tool.
+@tool
+def read_file_compressed(path: str, max_tokens: int = 2000) -> dict:
+    """Read a file, eliding the middle once it exceeds a token budget.
 
-CRITICAL: Your response MUST be ONLY a tool call. DO NOT write text.
-DO NOT say "I will read the file..."
-DO NOT explain what you're doing.
-ONLY call the read_file tool with the file path."""
+    Keeps the head and tail of the file plus any middle line matching
+    common error markers, preserving the signal in logs and long output
+    while bounding what flows into the model context. Returns a dict with
+    kept/elided line counts and the compressed content.
+    """
+    content = _read_text(path)
+    if len(content) // 4 <= max_tokens:
+        return {"kept": content.count("\n") + 1, "elided": 0, "content": content}
+
+    lines = content.splitlines()
+    # Spend half the budget on the head, half on the tail
+    edge_chars = max_tokens * 4 // 2
+    head = []
+    used = 0
+    for line in lines:
+        if used + len(line) > edge_chars:
+            break
+        head.append(line)
+        used += len(line) + 1
+    tail = []
+    used = 0
+    for line in reversed(lines[len(head):]):
+        if used + len(line) > edge_chars:
+            break
+        tail.append(line)
+        used += len(line) + 1
+    tail.reverse()
+
+    middle = lines[len(head):len(lines) - len(tail)]
+    errors = [line for line in middle if _ERROR_LINE_RE.search(line)]
+    elided = len(middle) - len(errors)
+    return {
+        "kept": len(head) + len(errors) + len(tail),
+        "elided": elided,
+        "content": "\n".join(
+            head + errors + [f"... [{elided} lines elided] ..."] + tail
+        ),
+    }
 
-    # ========================================
-    # TEST 1: Native Tool - Minimal Description (2 messages)
-    # ========================================
-    print("📝 TEST 1: NATIVE TOOL (Minimal - 2 messages)")
-    print("-" * 80)
-    print("Hypothesis: Minimal context + minimal tool = best performance")
-    print()
-
-    test1_messages = [
-        SystemMessage(content=minimal_system_prompt.replace("read_file", "read_file_minimal")),
-        HumanMessage(content=f"Read the file at {test_file_path}")
+# Give every native read tool the non-blocking twin for async invocation
+# paths: a sync read invoked via ainvoke would otherwise hold the event loop
+# for the whole file read
+for _read_tool in (read_file_minimal, read_file_verbose, read_file_compact):
+    _read_tool.coroutine = _read_text_async
+
+# bind_tools and input-schema serialization are pure functions of the tool,
+# so they're memoized by tool name (lru_cache needs hashable keys; the tool
+# objects themselves aren't). Repeat runs and the summary hit the cache.
+_TOOLS_BY_NAME = {}
+
+def _register(test_tool):
+    """Make a tool addressable by name for the lru_cached helpers below."""
+    _TOOLS_BY_NAME[test_tool.name] = test_tool
+    return test_tool.name
+
+@functools.lru_cache(maxsize=32)
+def _bind_by_name(tool_name):
+    return model.bind_tools([_TOOLS_BY_NAME[tool_name]])
+
+@functools.lru_cache(maxsize=32)
+def _schema_by_name(tool_name):
+    test_tool = _TOOLS_BY_NAME[tool_name]
+    if hasattr(test_tool, 'get_input_schema'):
+        # Compact JSON matches what providers actually put on the wire,
+        # unlike the Python dict repr
+        return json.dumps(test_tool.get_input_schema().schema(), separators=(',', ':'))
+    return str(test_tool)
+
+def bind_tools_cached(test_tool):
+    """Memoized model.bind_tools for a single tool."""
+    return _bind_by_name(_register(test_tool))
+
+def tool_schema_cached(test_tool):
+    """Memoized serialized input schema for a single tool."""
+    return _schema_by_name(_register(test_tool))
+
+# The native tool schemas are fully known at import, so serialize them
+# eagerly - test runs and reruns only ever read the cache. The MCP tool
+# joins the same cache once it's discovered at runtime.
+for _native_tool in (read_file_minimal, read_file_verbose, read_file_compact):
+    tool_schema_cached(_native_tool)
+
+# MCP client is a process-wide singleton: spawning the npx filesystem server
+# costs hundreds of ms of Node startup, so it's paid once per process rather
+# than once per run_tests() call. The lock keeps concurrent first callers
+# from racing the initialization.
+_MCP_FILES_DIR = str((current_dir / "src/deep_research_from_scratch/files").resolve())
+_MCP_CONFIG = {
+    "filesystem": {
+        "command": "npx",
+        "args": [
+            "-y",
+            "@modelcontextprotocol/server-filesystem",
+            _MCP_FILES_DIR
+        ],
+        "transport": "stdio"
+    }
+}
+_mcp_client = None
+_mcp_read_tool = None
+_mcp_lock = asyncio.Lock()
+
+async def get_mcp_read_tool():
+    """Return the MCP read_file tool, initializing the client exactly once."""
+    global _mcp_client, _mcp_read_tool
+    async with _mcp_lock:
+        if _mcp_client is None:
+            client = MultiServerMCPClient(_MCP_CONFIG)
+            # A hung npx/server start shouldn't stall the whole comparison;
+            # on timeout the client isn't kept, so a later call can retry
+            try:
+                mcp_tools = await asyncio.wait_for(client.get_tools(), timeout=5.0)
+            except asyncio.TimeoutError:
+                return None
+            _mcp_client = client
+            _mcp_read_tool = next(
+                (t for t in mcp_tools if t.name in ["read_file", "read_text_file"]),
+                None,
+            )
+    return _mcp_read_tool
+
+# Opt-in precise tokenizer: with tiktoken installed (it isn't a declared
+# dependency), schema sizes become true token counts; otherwise the
+# heuristic below stands in
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _ENCODING = None
+
+def estimate_schema_tokens(schema_text):
+    """Token count for a serialized tool schema.
+
+    Exact via tiktoken when available (microseconds per schema);
+    otherwise a heuristic: ASCII-dense schema JSON tokenizes at roughly
+    4 chars/token while non-ASCII characters often cost more than a
+    token each. The small constant covers per-tool framing in the chat
+    template.
+    """
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(schema_text)) + 3
+    ascii_chars = sum(c.isascii() for c in schema_text)
+    nonascii_chars = len(schema_text) - ascii_chars
+    return int(ascii_chars * 0.25 + nonascii_chars * 1.3) + 3
+
+# The user turn is identical across tests; the system prompt differs only by
+# the substituted tool name, so each variant is computed once and reused
+_HUMAN_MESSAGE = HumanMessage(content=f"Read the file at {test_file_path}")
+
+@functools.lru_cache(maxsize=8)
+def _build_messages(tool_name):
+    """Memoized 2-message test conversation for a given tool name."""
+    return [
+        SystemMessage(content=MINIMAL_SYSTEM_PROMPT.replace("read_file", tool_name)),
+        _HUMAN_MESSAGE,
     ]
 
-    # Check tool schema size
-    model_with_minimal = model.bind_tools([read_file_minimal])
-    tool_schema_minimal = read_file_minimal.get_input_schema().schema()
-    schema_size_minimal = len(str(tool_schema_minimal))
+def _check_prompt_lengths(tool_names, echo=print):
+    """Flag unequal system prompts so schema size stays the only variable.
 
-    print(f"Message count: {len(test1_messages)}")
-    print(f"Tool schema size: {schema_size_minimal} chars")
-    print(f"Tool description: '{read_file_minimal.description}'")
-    print()
+    The tool-name substitution changes prompt length by a few characters
+    per variant; if the lengths diverge, the comparison is no longer purely
+    about schema overhead, so say so up front rather than silently biasing
+    the conclusion.
+    """
+    lengths = {name: len(_build_messages(name)[0].content) for name in tool_names}
+    if len(set(lengths.values())) > 1:
+        echo(f"⚠️  System prompt lengths differ by tool name: {lengths}")
+        echo("   (schema size is not the only variable between tests)")
+        echo()
+
+async def run_test_1():
+    """Native tool with minimal description at minimal context."""
+    messages = _build_messages("read_file_minimal")
+    model_with_minimal = bind_tools_cached(read_file_minimal)
+    tool_schema = tool_schema_cached(read_file_minimal)
+    schema_tokens = estimate_schema_tokens(tool_schema)
+
+    response = await model_with_minimal.ainvoke(messages)
+    return {
+        "label": "TEST 1: NATIVE TOOL (Minimal - 2 messages)",
+        "hypothesis": "Minimal context + minimal tool = best performance",
+        "message_count": len(messages),
+        "schema_tokens": schema_tokens,
+        "description_preview": read_file_minimal.description,
+        "response": response,
+        "success": bool(response.tool_calls),
+    }
 
-    response1 = model_with_minimal.invoke(test1_messages)
+async def run_test_2():
+    """Native tool with verbose (MCP-like) description at minimal context."""
+    messages = _build_messages("read_file_verbose")
+    model_with_verbose = bind_tools_cached(read_file_verbose)
+    tool_schema = tool_schema_cached(read_file_verbose)
+    schema_tokens = estimate_schema_tokens(tool_schema)
+
+    response = await model_with_verbose.ainvoke(messages)
+    return {
+        "label": "TEST 2: NATIVE TOOL (Verbose - 2 messages)",
+        "hypothesis": "Verbose tool descriptions impact performance even with minimal context",
+        "message_count": len(messages),
+        "schema_tokens": schema_tokens,
+        "description_preview": f"{read_file_verbose.description[:100]}...",
+        "response": response,
+        "success": bool(response.tool_calls),
+    }
 
-    print("Response:")
-    if response1.tool_calls:
-        print(f"  ✅ Called tool: {response1.tool_calls[0]['name']}")
-        print(f"     Args: {response1.tool_calls[0]['args']}")
-    else:
-        print(f"  ❌ Text response (no tool call)")
-        print(f"     Content: {response1.content[:200]}...")
-    print()
-    print()
+async def run_test_4():
+    """Native tool with compact single-line description at minimal context."""
+    messages = _build_messages("read_file_compact")
+    model_with_compact = bind_tools_cached(read_file_compact)
+    tool_schema = tool_schema_cached(read_file_compact)
+    schema_tokens = estimate_schema_tokens(tool_schema)
+
+    response = await model_with_compact.ainvoke(messages)
+    return {
+        "label": "TEST 4: NATIVE TOOL (Compact - 2 messages)",
+        "hypothesis": "A minified description keeps verbose semantics at a fraction of the tokens",
+        "message_count": len(messages),
+        "schema_tokens": schema_tokens,
+        "description_preview": read_file_compact.description,
+        "response": response,
+        "success": bool(response.tool_calls),
+    }
 
-    # ========================================
-    # TEST 2: Native Tool - Verbose Description (2 messages)
-    # ========================================
-    print("📝 TEST 2: NATIVE TOOL (Verbose - 2 messages)")
-    print("-" * 80)
-    print("Hypothesis: Verbose tool descriptions impact performance even with minimal context")
-    print()
-
-    test2_messages = [
-        SystemMessage(content=minimal_system_prompt.replace("read_file", "read_file_verbose")),
-        HumanMessage(content=f"Read the file at {test_file_path}")
-    ]
+async def run_test_3(read_file_mcp):
+    """MCP filesystem tool at minimal context."""
+    messages = _build_messages(read_file_mcp.name)
+    model_with_mcp = bind_tools_cached(read_file_mcp)
+    tool_schema = tool_schema_cached(read_file_mcp)
+    schema_tokens = estimate_schema_tokens(tool_schema)
+
+    response = await model_with_mcp.ainvoke(messages)
+    return {
+        "label": "TEST 3: MCP TOOL (2 messages)",
+        "hypothesis": "MCP tools perform similarly to native tools at same context level",
+        "message_count": len(messages),
+        "schema_tokens": schema_tokens,
+        "description_preview": f"{read_file_mcp.description[:100]}...",
+        "response": response,
+        "success": bool(response.tool_calls),
+    }
 
-    # Check tool schema size
-    model_with_verbose = model.bind_tools([read_file_verbose])
-    tool_schema_verbose = read_file_verbose.get_input_schema().schema()
-    schema_size_verbose = len(str(tool_schema_verbose))
+# Conclusion text per (test1, test2, test3) success combination; states not
+# listed fall through to the mixed-results summary
+_CONCLUSIONS = {
+    (True, True, True): (
+        "🔍 CONCLUSION: All tools work equally well at minimal context\n"
+        "   → MCP overhead is NOT causing the tool calling failures\n"
+        "   → Tool schema token count doesn't matter at this context level\n"
+        "   → The problem is definitely MESSAGE HISTORY, not tool definitions"
+    ),
+    (True, False, False): (
+        "🔍 CONCLUSION: Verbose tool schemas impact performance\n"
+        "   → Even at minimal context, verbose descriptions cause failures\n"
+        "   → MCP's detailed schemas ARE contributing to the problem\n"
+        "   → Using minimal native tools is the path forward"
+    ),
+    (True, True, False): (
+        "🔍 CONCLUSION: MCP has unique overhead beyond description verbosity\n"
+        "   → MCP adds context bloat beyond just the tool description\n"
+        "   → Native tools (even verbose) perform better than MCP\n"
+        "   → Should replace MCP with native file operations"
+    ),
+    (False, False, False): (
+        "🔍 CONCLUSION: Even minimal context (2 messages) is too much\n"
+        "   → The system prompt + user message alone overwhelm LFM2\n"
+        "   → Tool schemas are irrelevant - base context is the problem\n"
+        "   → May need to drastically simplify prompts or use different architecture"
+    ),
+}
+
+def _mixed_conclusion(successes):
+    """Fallback conclusion for success combinations not in _CONCLUSIONS."""
+    lines = [
+        "🔍 CONCLUSION: Mixed results - partial success",
+        f"   → Successes: {sum(successes)}/3",
+    ]
+    if successes[2] and not successes[0]:
+        lines.append("   → UNEXPECTED: MCP performs better than native minimal tool!")
+    lines.append("   → Further investigation needed")
+    return "\n".join(lines)
+
+# With FAST_FAIL=1, a text response from the minimal-schema test skips the
+# remaining tests: every other condition has a strictly larger schema, so
+# their failure is already implied and the round-trips would only confirm it
+_FAST_FAIL = os.environ.get("FAST_FAIL") == "1"
+
+def _skipped_result(label, test_tool):
+    """Placeholder result for a test pruned under FAST_FAIL."""
+    return {
+        "label": label,
+        "hypothesis": "(skipped under FAST_FAIL)",
+        "message_count": 2,
+        "schema_tokens": estimate_schema_tokens(tool_schema_cached(test_tool)),
+        "description_preview": "(not run)",
+        "response": None,
+        "success": False,
+        "skipped": True,
+    }
 
-    print(f"Message count: {len(test2_messages)}")
-    print(f"Tool schema size: {schema_size_verbose} chars")
-    print(f"Tool description: '{read_file_verbose.description[:100]}...'")
-    print()
+def _outcome(result):
+    """Summary-row outcome string, keeping skipped tests distinct from
+    measured failures."""
+    if result.get("skipped"):
+        return "⏭️  Skipped (not measured)"
+    return "✅ Tool call" if result["success"] else "❌ Text response"
+
+def _print_test_report(result, echo=print):
+    """Print one test's setup and response outcome."""
+    echo(f"📝 {result['label']}")
+    echo("-" * 80)
+    echo(f"Hypothesis: {result['hypothesis']}")
+    echo()
+    echo(f"Message count: {result['message_count']}")
+    echo(f"Tool schema size: ~{result['schema_tokens']} tokens")
+    echo(f"Tool description: '{result['description_preview']}'")
+    echo()
+
+    response = result["response"]
+    echo("Response:")
+    if result.get("skipped"):
+        echo("  ⏭️  Skipped (FAST_FAIL=1: dominated by the failed minimal test)")
+    elif response.tool_calls:
+        echo(f"  ✅ Called tool: {response.tool_calls[0]['name']}")
+        echo(f"     Args: {response.tool_calls[0]['args']}")
+    else:
+        echo(f"  ❌ Text response (no tool call)")
+        echo(f"     Content: {response.content[:200]}...")
+    echo()
+    echo()
 
-    response2 = model_with_verbose.invoke(test2_messages)
+async def run_tests():
+    """Run comparison tests between MCP and native tools."""
 
-    print("Response:")
-    if response2.tool_calls:
-        print(f"  ✅ Called tool: {response2.tool_calls[0]['name']}")
-        print(f"     Args: {response2.tool_calls[0]['args']}")
-    else:
-        print(f"  ❌ Text response (no tool call)")
-        print(f"     Content: {response2.content[:200]}...")
-    print()
-    print()
+    # The whole report accumulates in one buffer and is written to stdout
+    # in a single call at the end - no line-buffered flush per print, and
+    # the output stays atomic even with async work interleaved
+    buf = io.StringIO()
+    echo = functools.partial(print, file=buf)
 
-    # ========================================
-    # TEST 3: MCP Tool (2 messages)
-    # ========================================
-    print("📝 TEST 3: MCP TOOL (2 messages)")
-    print("-" * 80)
-    print("Hypothesis: MCP tools perform similarly to native tools at same context level")
-    print()
-
-    # Initialize MCP client
-    mcp_config = {
-        "filesystem": {
-            "command": "npx",
-            "args": [
-                "-y",
-                "@modelcontextprotocol/server-filesystem",
-                str(current_dir / "src/deep_research_from_scratch/files")
-            ],
-            "transport": "stdio"
-        }
-    }
+    echo("="*80)
+    echo("MCP vs NATIVE TOOLS COMPARISON - CONTROLLED")
+    echo("="*80)
+    echo()
+    echo("Testing whether MCP tool schemas bloat context compared to native tools")
+    echo("Using IDENTICAL message structure for fair comparison")
+    echo()
 
-    client = MultiServerMCPClient(mcp_config)
-    mcp_tools = await client.get_tools()
-    read_file_mcp = next((t for t in mcp_tools if t.name in ["read_file", "read_text_file"]), None)
+    # Initialize (or reuse) the MCP client up front - test 3 depends on it
+    read_file_mcp = await get_mcp_read_tool()
 
     if not read_file_mcp:
-        print("❌ MCP read_file tool not found!")
+        echo("❌ MCP read_file tool not available (missing or discovery timed out)!")
+        sys.stdout.write(buf.getvalue())
         return
 
-    # Check tool schema size
-    model_with_mcp = model.bind_tools([read_file_mcp])
-    tool_schema_mcp = read_file_mcp.get_input_schema().schema() if hasattr(read_file_mcp, 'get_input_schema') else str(read_file_mcp)
-    schema_size_mcp = len(str(tool_schema_mcp))
-
-    print(f"Message count: 2")
-    print(f"Tool schema size: {schema_size_mcp} chars")
-    print(f"Tool description: '{read_file_mcp.description[:100]}...'")
-    print()
-
-    test3_messages = [
-        SystemMessage(content=minimal_system_prompt.replace("read_file", read_file_mcp.name)),
-        HumanMessage(content=f"Read the file at {test_file_path}")
-    ]
-
-    response3 = model_with_mcp.invoke(test3_messages)
-
-    print("Response:")
-    if response3.tool_calls:
-        print(f"  ✅ Called tool: {response3.tool_calls[0]['name']}")
-        print(f"     Args: {response3.tool_calls[0]['args']}")
+    _check_prompt_lengths(
+        ("read_file_minimal", "read_file_verbose", read_file_mcp.name,
+         "read_file_compact"),
+        echo,
+    )
+
+    # Pre-warm the bind and schema caches in parallel so no test carries
+    # one-time CPU-bound setup inside its measured path. The native tool
+    # schemas are serialized at import; only the MCP tool's schema is
+    # unknown until now, so it warms alongside the bindings.
+    await asyncio.gather(
+        asyncio.to_thread(bind_tools_cached, read_file_minimal),
+        asyncio.to_thread(bind_tools_cached, read_file_verbose),
+        asyncio.to_thread(bind_tools_cached, read_file_mcp),
+        asyncio.to_thread(bind_tools_cached, read_file_compact),
+        asyncio.to_thread(tool_schema_cached, read_file_mcp),
+    )
+
+    # The tests are independent, so their LLM round-trips overlap; wall
+    # time is roughly the slowest single test instead of the sum. Under
+    # FAST_FAIL, test 1 resolves first so a failure can prune the rest.
+    if _FAST_FAIL:
+        result1 = await run_test_1()
+        if not result1["success"]:
+            echo("⚡ FAST_FAIL=1: minimal tool got a text response; skipping the larger-schema tests")
+            echo()
+            results = [
+                result1,
+                _skipped_result("TEST 2: NATIVE TOOL (Verbose - 2 messages)", read_file_verbose),
+                _skipped_result("TEST 3: MCP TOOL (2 messages)", read_file_mcp),
+                _skipped_result("TEST 4: NATIVE TOOL (Compact - 2 messages)", read_file_compact),
+            ]
+        else:
+            rest = await asyncio.gather(
+                run_test_2(), run_test_3(read_file_mcp), run_test_4()
+            )
+            results = [result1, *rest]
     else:
-        print(f"  ❌ Text response (no tool call)")
-        print(f"     Content: {response3.content[:200]}...")
-    print()
-    print()
+        results = await asyncio.gather(
+            run_test_1(), run_test_2(), run_test_3(read_file_mcp), run_test_4()
+        )
+    for result in results:
+        _print_test_report(result, echo)
 
     # ========================================
     # SUMMARY
     # ========================================
-    print("="*80)
-    print("SUMMARY")
-    print("="*80)
-
-    test1_success = bool(response1.tool_calls)
-    test2_success = bool(response2.tool_calls)
-    test3_success = bool(response3.tool_calls)
-
-    print("\nTool Schema Sizes:")
-    print(f"  Native (Minimal):  {schema_size_minimal:4d} chars")
-    print(f"  Native (Verbose):  {schema_size_verbose:4d} chars")
-    print(f"  MCP Tool:          {schema_size_mcp:4d} chars")
-    print()
-
-    print("Tool Calling Success:")
-    print(f"  Native (Minimal):  {'✅ Tool call' if test1_success else '❌ Text response'}")
-    print(f"  Native (Verbose):  {'✅ Tool call' if test2_success else '❌ Text response'}")
-    print(f"  MCP Tool:          {'✅ Tool call' if test3_success else '❌ Text response'}")
-    print()
+    echo("="*80)
+    echo("SUMMARY")
+    echo("="*80)
+
+    result1, result2, result3, result4 = results
+    test1_success = result1["success"]
+    test2_success = result2["success"]
+    test3_success = result3["success"]
+    schema_tokens_minimal = result1["schema_tokens"]
+    schema_tokens_verbose = result2["schema_tokens"]
+    schema_tokens_mcp = result3["schema_tokens"]
+    schema_tokens_compact = result4["schema_tokens"]
+
+    echo("\nTool Schema Sizes:")
+    echo(f"  Native (Minimal):  ~{schema_tokens_minimal:4d} tokens")
+    echo(f"  Native (Verbose):  ~{schema_tokens_verbose:4d} tokens")
+    echo(f"  MCP Tool:          ~{schema_tokens_mcp:4d} tokens")
+    echo(f"  Native (Compact):  ~{schema_tokens_compact:4d} tokens")
+    echo()
+
+    echo("Tool Calling Success:")
+    echo(f"  Native (Minimal):  {_outcome(result1)}")
+    echo(f"  Native (Verbose):  {_outcome(result2)}")
+    echo(f"  MCP Tool:          {_outcome(result3)}")
+    echo(f"  Native (Compact):  {_outcome(result4)}")
+    echo()
 
     # Analysis
-    schema_diff_verbose = schema_size_verbose - schema_size_minimal
-    schema_diff_mcp = schema_size_mcp - schema_size_minimal
-
-    print(f"\nSchema overhead:")
-    print(f"  Verbose vs Minimal: +{schema_diff_verbose} chars ({(schema_diff_verbose/schema_size_minimal*100):.1f}% increase)")
-    print(f"  MCP vs Minimal:     +{schema_diff_mcp} chars ({(schema_diff_mcp/schema_size_minimal*100):.1f}% increase)")
-    print()
-
-    if test1_success and test2_success and test3_success:
-        print("🔍 CONCLUSION: All tools work equally well at minimal context")
-        print("   → MCP overhead is NOT causing the tool calling failures")
-        print("   → Tool schema size (162 vs 838 chars) doesn't matter at this context level")
-        print("   → The problem is definitely MESSAGE HISTORY, not tool definitions")
-    elif test1_success and not test2_success and not test3_success:
-        print("🔍 CONCLUSION: Verbose tool schemas impact performance")
-        print("   → Even at minimal context, verbose descriptions cause failures")
-        print("   → MCP's detailed schemas ARE contributing to the problem")
-        print("   → Using minimal native tools is the path forward")
-    elif test1_success and test2_success and not test3_success:
-        print("🔍 CONCLUSION: MCP has unique overhead beyond description verbosity")
-        print("   → MCP adds context bloat beyond just the tool description")
-        print("   → Native tools (even verbose) perform better than MCP")
-        print("   → Should replace MCP with native file operations")
-    elif not test1_success and not test2_success and not test3_success:
-        print("🔍 CONCLUSION: Even minimal context (2 messages) is too much")
-        print("   → The system prompt + user message alone overwhelm LFM2")
-        print("   → Tool schemas are irrelevant - base context is the problem")
-        print("   → May need to drastically simplify prompts or use different architecture")
-    else:
-        print("🔍 CONCLUSION: Mixed results - partial success")
-        print(f"   → Successes: {sum([test1_success, test2_success, test3_success])}/3")
-        if test3_success and not test1_success:
-            print("   → UNEXPECTED: MCP performs better than native minimal tool!")
-        print("   → Further investigation needed")
-    print()
+    schema_diff_verbose = schema_tokens_verbose - schema_tokens_minimal
+    schema_diff_mcp = schema_tokens_mcp - schema_tokens_minimal
+
+    echo(f"\nSchema overhead:")
+    echo(f"  Verbose vs Minimal: +{schema_diff_verbose} tokens ({(schema_diff_verbose/schema_tokens_minimal*100):.1f}% increase)")
+    echo(f"  MCP vs Minimal:     +{schema_diff_mcp} tokens ({(schema_diff_mcp/schema_tokens_minimal*100):.1f}% increase)")
+    compact_saving = schema_tokens_verbose - schema_tokens_compact
+    echo(f"  Compact vs Verbose: -{compact_saving} tokens ({(compact_saving/schema_tokens_verbose*100):.1f}% reduction at equivalent semantics)")
+    echo()
+
+    conclusion_key = (test1_success, test2_success, test3_success)
+    echo(_CONCLUSIONS.get(conclusion_key) or _mixed_conclusion(conclusion_key))
+    if any(r.get("skipped") for r in results):
+        echo("   (skipped tests were not measured; their failure is inferred"
+             " from the minimal tool failing with a smaller schema)")
+    echo()
+
+    sys.stdout.write(buf.getvalue())
+    # Structured return so sweeps can rerun this comparison and aggregate
+    return results, conclusion_key
 
 if __name__ == "__main__":
     asyncio.run(run_tests())